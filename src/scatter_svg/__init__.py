@@ -7,24 +7,40 @@ with professional-quality output.
 
 __version__ = "1.0.0"
 
+import os
+
 from scatter_svg.plot import (
+    Point,
     load_stdin,
     load_json_stdin,
     load_json_file,
     load_csv_file,
+    load_csv_file_iter,
+    load_csv_file_pandas,
     load_data_file,
+    load_data_files,
     detect_file_format,
     create_scatter_plot,
     save_figure,
+    warm_matplotlib,
 )
 
 __all__ = [
+    "Point",
     "load_stdin",
     "load_json_stdin",
     "load_json_file",
     "load_csv_file",
+    "load_csv_file_iter",
+    "load_csv_file_pandas",
     "load_data_file",
+    "load_data_files",
     "detect_file_format",
     "create_scatter_plot",
     "save_figure",
+    "warm_matplotlib",
 ]
+
+# Opt-in: pay matplotlib's startup costs at import time (useful for servers)
+if os.environ.get("SCATTER_SVG_WARM") == "1":
+    warm_matplotlib()
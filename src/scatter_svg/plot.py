@@ -15,6 +15,9 @@ Usage:
     # From JSON file
     ./plot-models-scatter.py models.json output.svg
 
+    # Gzip-compressed SVG (drop-in replacement for .svg, much smaller)
+    ./plot-models-scatter.py models.json output.svgz
+
 Note: stdin input automatically detects JSON vs CSV format
 
 Input Format (JSON):
@@ -36,112 +39,382 @@ Input Format (CSV):
     ...
 
 Dependencies:
-    pip install matplotlib adjustText pandas
+    pip install matplotlib numpy adjustText
+    pip install pandas  # optional, for load_csv_file_pandas
 
 Author: OpenCode Visualization Research
 Date: October 14, 2025
 """
 
+import os
 import sys
+import csv
 import json
-import io
 import argparse
+import functools
+import itertools
+import importlib.util
+from collections.abc import Mapping
 from pathlib import Path
 
-import matplotlib.pyplot as plt
-from adjustText import adjust_text
-import pandas as pd
+# numpy, matplotlib, adjustText and pandas are imported inside the functions that use
+# them, so --help, argument errors and missing input files return immediately
+
+# Prefer pyarrow's multithreaded CSV parser when it is installed (probed without
+# importing it, which is slow)
+_CSV_ENGINE = "pyarrow" if importlib.util.find_spec("pyarrow") is not None else "c"
+
+# Parse JSON input with orjson when it is installed (all JSON loaders use it)
+try:
+    import orjson
+
+    def _json_loads(data):
+        """Parse JSON with orjson, retrying with json for input orjson rejects."""
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            # json also accepts the NaN/Infinity literals that json.dumps writes
+            return json.loads(data)
+
+except ImportError:
+    _json_loads = json.loads
+
+# Run adjust_text's force-directed layout only up to this many labels; beyond it the
+# relaxation dominates runtime and labels are left centred on their points
+ADJUST_TEXT_MAX = 150
+
+# Merge labels of near-coincident points only above this many points; smaller
+# plots keep every label and let adjust_text spread them out. Tied to
+# ADJUST_TEXT_MAX so every plot too large for adjust_text gets merging instead.
+MERGE_LABELS_MIN_POINTS = ADJUST_TEXT_MAX
+
+# Label box style, shared read-only by every label
+_LABEL_BBOX = dict(boxstyle="round,pad=0.3", facecolor="white", edgecolor="none", alpha=0.7)
+
+# How much of an extensionless file to read when sniffing its format; enough to
+# get past indentation or blank lines before the first JSON token
+_SNIFF_BYTES = 512
+
+# Field values read as missing (NaN), matching pandas.read_csv's default na_values
+_CSV_NA_VALUES = frozenset(
+    (
+        "",
+        "#N/A",
+        "#N/A N/A",
+        "#NA",
+        "-1.#IND",
+        "-1.#QNAN",
+        "-NaN",
+        "-nan",
+        "1.#IND",
+        "1.#QNAN",
+        "<NA>",
+        "N/A",
+        "NA",
+        "NULL",
+        "NaN",
+        "None",
+        "n/a",
+        "nan",
+        "null",
+    )
+)
+
+# Substrings that identify the label, x and y columns in tabular input
+_LABEL_KEYWORDS = ("label", "name")
+_X_KEYWORDS = ("x", "speed", "time")
+_Y_KEYWORDS = ("y", "quality", "tier")
+
+
+class Point(Mapping):
+    """
+    A labeled data point, as produced by the CSV loaders.
+
+    Uses __slots__ to keep large point sets compact; read fields as attributes
+    (point.x) where speed matters. It also implements the Mapping interface with
+    the keys 'label', 'x' and 'y', so it can be used wherever a point dict from
+    JSON input is (point["x"], "x" in point, point.get(), dict(point)) and
+    compares equal to the matching dict. Use to_dict() for a real dict, e.g.
+    for json.dumps.
+    """
+
+    __slots__ = ("label", "x", "y")
+
+    def __init__(self, label, x, y):
+        self.label = label
+        self.x = x
+        self.y = y
+
+    def __getitem__(self, key):
+        if key not in self.__slots__:
+            raise KeyError(key)
+        return getattr(self, key)
+
+    def __iter__(self):
+        return iter(self.__slots__)
+
+    def __len__(self):
+        return len(self.__slots__)
+
+    def __contains__(self, key):
+        return key in self.__slots__
+
+    def to_dict(self):
+        """Return the point as a plain dict."""
+        return {"label": self.label, "x": self.x, "y": self.y}
+
+    def __repr__(self):
+        return f"Point(label={self.label!r}, x={self.x!r}, y={self.y!r})"
 
 
 def load_stdin():
     """
     Load data from stdin with automatic format detection.
 
-    Tries to parse as JSON first, falls back to CSV if JSON parsing fails.
+    Input starting with '{' or '[' is parsed as JSON, anything else as CSV.
 
     Returns:
         Dict with 'points', 'title', 'xlabel', 'ylabel'
     """
-    # Read all stdin content once
-    stdin_content = sys.stdin.read()
+    # Peek at the first non-whitespace byte instead of reading everything and
+    # attempting a JSON parse that is thrown away for CSV input
+    buffer = getattr(sys.stdin, "buffer", None)
+    if hasattr(buffer, "peek"):
+        if _skip_whitespace(buffer) in (b"{", b"["):
+            # Nothing was consumed past the whitespace, so the parser gets the
+            # whole document in a single copy
+            return _load_json_stream(buffer)
+        # The text layer reads on from the first non-whitespace byte
+        return _csv_rows_to_data(csv.reader(sys.stdin))
+
+    # Text-only stream (no peekable byte buffer): read one character at a time
+    first = sys.stdin.read(1)
+    while first.isspace():
+        first = sys.stdin.read(1)
+
+    if first in ("{", "["):
+        return _json_loads(first + sys.stdin.read())
+
+    # Stream CSV rows straight from stdin; the peeked character starts the header
+    header_line = first + sys.stdin.readline()
+    return _csv_rows_to_data(csv.reader(itertools.chain([header_line], sys.stdin)))
+
+
+def _skip_whitespace(buffer):
+    """
+    Consume leading whitespace from a peekable binary stream.
 
-    # Try parsing as JSON first
-    try:
-        data = json.loads(stdin_content)
-        return data
-    except json.JSONDecodeError:
-        # Fall back to CSV parsing
-        csv_buffer = io.StringIO(stdin_content)
-        df = pd.read_csv(csv_buffer)
-
-        # Detect column names (same logic as load_csv_file)
-        label_col = next(
-            (c for c in df.columns if "label" in c.lower() or "name" in c.lower()), df.columns[0]
-        )
-        x_col = next(
-            (
-                c
-                for c in df.columns
-                if "x" in c.lower() or "speed" in c.lower() or "time" in c.lower()
-            ),
-            df.columns[1],
-        )
-        y_col = next(
-            (
-                c
-                for c in df.columns
-                if "y" in c.lower() or "quality" in c.lower() or "tier" in c.lower()
-            ),
-            df.columns[2],
-        )
+    Args:
+        buffer: Binary stream with a peek() method, e.g. sys.stdin.buffer
 
-        return {
-            "points": [
-                {"label": row[label_col], "x": row[x_col], "y": row[y_col]}
-                for _, row in df.iterrows()
-            ],
-            "xlabel": x_col,
-            "ylabel": y_col,
-            "title": "Scatter Plot",
-        }
+    Returns:
+        The next byte, left unconsumed, or b"" at end of input
+    """
+    while True:
+        head = buffer.peek(1)
+        if not head:
+            return b""
+        rest = head.lstrip()
+        buffer.read(len(head) - len(rest))
+        if rest:
+            return rest[:1]
 
 
 def load_json_stdin():
     """Load JSON data from stdin (deprecated - use load_stdin instead)."""
-    return json.load(sys.stdin)
+    return _load_json_stream(getattr(sys.stdin, "buffer", sys.stdin))
 
 
 def load_json_file(filepath):
     """Load JSON data from file."""
-    with open(filepath) as f:
-        return json.load(f)
+    with open(filepath, "rb") as f:
+        return _load_json_stream(f)
+
+
+def _load_json_stream(f):
+    """
+    Parse a JSON document from a binary file object.
+
+    The raw bytes are read in one call and parsed with orjson when it is
+    installed, otherwise with the stdlib parser.
+    """
+    return _json_loads(f.read())
 
 
 def load_csv_file(filepath):
     """Load CSV data and convert to expected format."""
-    df = pd.read_csv(filepath)
+    with open(filepath, newline="", encoding="utf-8-sig") as f:
+        return _csv_rows_to_data(csv.reader(f))
 
-    # Detect column names (flexible)
-    label_col = next(
-        (c for c in df.columns if "label" in c.lower() or "name" in c.lower()), df.columns[0]
-    )
-    x_col = next(
-        (c for c in df.columns if "x" in c.lower() or "speed" in c.lower() or "time" in c.lower()),
-        df.columns[1],
-    )
-    y_col = next(
-        (
-            c
-            for c in df.columns
-            if "y" in c.lower() or "quality" in c.lower() or "tier" in c.lower()
-        ),
-        df.columns[2],
-    )
+
+def load_csv_file_iter(filepath):
+    """
+    Stream points from a CSV file one row at a time.
+
+    Unlike load_csv_file, no list of points is built, so memory use stays flat
+    for consumers that only need a single pass. The file is closed when the
+    iterator is exhausted or closed.
+
+    Args:
+        filepath: Path to the CSV file
+
+    Yields:
+        Point for each data row
+    """
+    with open(filepath, newline="", encoding="utf-8-sig") as f:
+        reader = csv.reader(f)
+        indices, _, _ = _read_csv_header(reader)
+        yield from _iter_csv_points(reader, indices)
+
+
+def load_csv_file_pandas(filepath):
+    """
+    Load CSV data with pandas and convert to expected format.
+
+    Slower to start than load_csv_file, but applies pandas' dtype inference
+    to the columns. Requires the optional pandas dependency.
+    """
+    df = _read_csv(filepath)
+    return _dataframe_to_data(df)
+
+
+def _csv_rows_to_data(reader):
+    """
+    Convert CSV rows to the expected format.
+
+    Args:
+        reader: csv.reader over the input, starting with the header row
+
+    Returns:
+        Dict with 'points', 'title', 'xlabel', 'ylabel'
+    """
+    indices, x_col, y_col = _read_csv_header(reader)
+    points = list(_iter_csv_points(reader, indices))
 
     return {
-        "points": [
-            {"label": row[label_col], "x": row[x_col], "y": row[y_col]} for _, row in df.iterrows()
-        ],
+        "points": points,
+        "xlabel": x_col,
+        "ylabel": y_col,
+        "title": "Scatter Plot",
+    }
+
+
+def _read_csv_header(reader):
+    """
+    Read the header row and locate the label, x and y columns.
+
+    Args:
+        reader: csv.reader over the input, positioned at the header row
+
+    Returns:
+        Tuple of ((label_index, x_index, y_index), x_col, y_col)
+    """
+    header = next(reader, None)
+    if not header:
+        raise ValueError("CSV input is empty")
+    # Drop a UTF-8 byte order mark (Excel writes one) that reached us undecoded,
+    # e.g. on stdin; files are opened as utf-8-sig, which removes it already
+    if header[0].startswith("\ufeff"):
+        header[0] = header[0][1:]
+
+    label_col, x_col, y_col = _detect_columns(header)
+    indices = header.index(label_col), header.index(x_col), header.index(y_col)
+    return indices, x_col, y_col
+
+
+def _iter_csv_points(reader, indices):
+    """
+    Convert CSV data rows to points in a single pass.
+
+    Args:
+        reader: csv.reader positioned after the header row
+        indices: Tuple of (label_index, x_index, y_index)
+
+    Yields:
+        Point for each data row; blank lines come through as empty rows and are
+        skipped, and empty, missing or NA-marked x/y fields become NaN
+    """
+    label_i, x_i, y_i = indices
+    for row in reader:
+        if not row:
+            continue
+        try:
+            point = Point(row[label_i], float(row[x_i]), float(row[y_i]))
+        except (IndexError, ValueError):
+            # Slow path for blank cells, NA markers and short rows, which pandas
+            # read as NaN
+            label = row[label_i] if label_i < len(row) else ""
+            x = _csv_float(row, x_i, reader.line_num)
+            y = _csv_float(row, y_i, reader.line_num)
+            point = Point(label, x, y)
+        yield point
+
+
+def _csv_float(row, index, line_num):
+    """Convert a CSV field to float, treating missing fields and NA markers as NaN."""
+    value = row[index].strip() if index < len(row) else ""
+    if value in _CSV_NA_VALUES:
+        return float("nan")
+    try:
+        return float(value)
+    except ValueError:
+        raise ValueError(f"CSV line {line_num}: could not convert {value!r} to a number") from None
+
+
+def _detect_columns(columns):
+    """
+    Detect the label, x and y columns by name, falling back to position.
+
+    Args:
+        columns: Sequence of column names
+
+    Returns:
+        Tuple of (label_col, x_col, y_col)
+    """
+    lowered = [str(c).lower() for c in columns]
+
+    def pick(keywords, default):
+        return next(
+            (c for c, low in zip(columns, lowered) if any(k in low for k in keywords)), default
+        )
+
+    label_col = pick(_LABEL_KEYWORDS, columns[0])
+    x_col = pick(_X_KEYWORDS, columns[1])
+    y_col = pick(_Y_KEYWORDS, columns[2])
+    return label_col, x_col, y_col
+
+
+def _read_csv(source):
+    """Read CSV into a DataFrame using the fastest available engine."""
+    import pandas as pd
+
+    if _CSV_ENGINE == "pyarrow":
+        # Keep columns Arrow-backed so column extraction avoids a copy
+        return pd.read_csv(source, engine="pyarrow", dtype_backend="pyarrow")
+    return pd.read_csv(source, engine="c", low_memory=False)
+
+
+def _dataframe_to_data(df):
+    """
+    Convert a CSV DataFrame to the expected format.
+
+    Columns are extracted whole instead of iterating rows, which avoids
+    building a Series per row.
+
+    Args:
+        df: DataFrame with label, x and y columns
+
+    Returns:
+        Dict with 'points', 'title', 'xlabel', 'ylabel'
+    """
+    label_col, x_col, y_col = _detect_columns(df.columns)
+
+    labels = df[label_col].to_numpy().tolist()
+    x_values = df[x_col].to_numpy().tolist()
+    y_values = df[y_col].to_numpy().tolist()
+
+    return {
+        "points": [Point(label, x, y) for label, x, y in zip(labels, x_values, y_values)],
         "xlabel": x_col,
         "ylabel": y_col,
         "title": "Scatter Plot",
@@ -158,30 +431,55 @@ def detect_file_format(filepath):
     Returns:
         'csv' or 'json'
     """
-    path = Path(filepath)
-
-    # First, check file extension
-    if path.suffix.lower() == ".csv":
+    # First, check file extension (no filesystem access needed)
+    suffix = Path(filepath).suffix.lower()
+    if suffix == ".csv":
         return "csv"
-    elif path.suffix.lower() == ".json":
+    elif suffix == ".json":
         return "json"
 
-    # No recognized extension - detect from content
+    # No recognized extension - sniff the content, cached per file version so
+    # repeated lookups of an unchanged file skip the read
     try:
-        with open(filepath, "r") as f:
-            content = f.read().strip()
+        mtime_ns = os.stat(filepath).st_mtime_ns
+    except OSError:
+        return _sniff_file_format(filepath)
+    return _sniff_file_format_cached(os.fspath(filepath), mtime_ns)
 
-        # Try to parse as JSON first
-        try:
-            json.loads(content)
-            return "json"
-        except json.JSONDecodeError:
-            # If JSON fails, assume CSV
-            return "csv"
-    except Exception:
+
+@functools.lru_cache(maxsize=1024)
+def _sniff_file_format_cached(path, mtime_ns):
+    """
+    Memoized _sniff_file_format for detect_file_format.
+
+    Only path and mtime_ns form the key; the caller stats the file, so a file
+    rewritten with new content gets a fresh entry instead of its old format.
+    """
+    return _sniff_file_format(path)
+
+
+def _sniff_file_format(filepath):
+    """
+    Detect CSV or JSON from the first non-whitespace byte of a file.
+
+    Reads only a small prefix; the file is never parsed.
+
+    Args:
+        filepath: Path to the input file
+
+    Returns:
+        'csv' or 'json'
+    """
+    try:
+        with open(filepath, "rb") as f:
+            head = f.read(_SNIFF_BYTES).lstrip()
+    except OSError:
         # Default to CSV if we can't read the file
         return "csv"
 
+    # JSON documents start with an object or array; anything else is CSV
+    return "json" if head[:1] in (b"{", b"[") else "csv"
+
 
 def load_data_file(filepath):
     """
@@ -201,7 +499,37 @@ def load_data_file(filepath):
         return load_json_file(filepath)
 
 
-def create_scatter_plot(data, figsize=(12, 8), style="default"):
+def load_data_files(filepaths):
+    """
+    Load several data files concurrently.
+
+    Reading is I/O bound, so the files are loaded on a thread pool to overlap
+    their open/read latency.
+
+    Args:
+        filepaths: Sequence of paths to input files (CSV or JSON)
+
+    Returns:
+        List of data dicts (see load_data_file), in the same order as filepaths
+    """
+    from concurrent.futures import ThreadPoolExecutor
+
+    filepaths = list(filepaths)
+    if not filepaths:
+        return []
+
+    with ThreadPoolExecutor(max_workers=min(32, len(filepaths))) as executor:
+        return list(executor.map(load_data_file, filepaths))
+
+
+def create_scatter_plot(
+    data,
+    figsize=(12, 8),
+    style="default",
+    rasterize_threshold=2000,
+    max_labels=5000,
+    force_adjust_text=False,
+):
     """
     Create scatter plot with collision-free labels.
 
@@ -209,59 +537,99 @@ def create_scatter_plot(data, figsize=(12, 8), style="default"):
         data: Dict with 'points', optional 'title', 'xlabel', 'ylabel'
         figsize: Tuple of (width, height) in inches
         style: Matplotlib style ('default', 'seaborn', 'ggplot', etc.)
+        rasterize_threshold: Rasterize markers when there are more points than this
+        max_labels: Label only a random sample of this many points when there are more
+        force_adjust_text: Run adjust_text even with more than ADJUST_TEXT_MAX labels
 
     Returns:
         matplotlib Figure object
     """
-    # Apply style
+    import numpy as np
+    import matplotlib.pyplot as plt
+    from adjustText import adjust_text
+    from matplotlib.font_manager import FontProperties
+
+    # Apply style (on every call: an edited style file or rcParams changed by the
+    # caller since the previous plot must take effect)
     if style != "default":
-        plt.style.use(style)
+        _use_style(style)
 
     # Create figure
     fig, ax = plt.subplots(figsize=figsize)
 
-    # Extract data
+    # Extract data (coordinates go straight into float arrays, which matplotlib
+    # uses without converting them again)
     points = data["points"]
-    x_values = [p["x"] for p in points]
-    y_values = [p["y"] for p in points]
-    labels = [p["label"] for p in points]
-
-    # Color by quality tier if y-values are discrete
-    unique_y = sorted(set(y_values))
-    if len(unique_y) <= 10:  # Assume discrete tiers
-        colors = plt.cm.viridis([y_values.index(y) / len(unique_y) for y in y_values])
+    n = len(points)
+    try:
+        # Points from the CSV loaders: plain slot reads, no per-item __getitem__
+        x_values = np.fromiter((p.x for p in points), dtype=np.float64, count=n)
+        y_values = np.fromiter((p.y for p in points), dtype=np.float64, count=n)
+        labels = [p.label for p in points]
+    except AttributeError:
+        # Point dicts from JSON input (possibly mixed with Points)
+        x_values = np.fromiter((p["x"] for p in points), dtype=np.float64, count=n)
+        y_values = np.fromiter((p["y"] for p in points), dtype=np.float64, count=n)
+        labels = [p["label"] for p in points]
+
+    # Color by quality tier if y-values are discrete (points with a missing y
+    # are not drawn, so they do not count as a tier)
+    unique_y = np.unique(y_values[~np.isnan(y_values)])
+    if 0 < len(unique_y) <= 10:  # Assume discrete tiers
+        tier_index = np.searchsorted(unique_y, y_values)
+        colors = plt.cm.viridis(tier_index / len(unique_y))
     else:
         colors = "steelblue"
 
-    # Plot scatter points
+    # Plot scatter points. Large point sets are rasterized so vector output embeds
+    # one image instead of one path per marker; axes, grid and labels stay vector.
+    # Rasterized markers drop the white edge, which only blurs at image resolution.
+    rasterize = len(points) > rasterize_threshold
     ax.scatter(
-        x_values, y_values, s=100, c=colors, alpha=0.6, edgecolors="white", linewidth=1.5, zorder=2
+        x_values,
+        y_values,
+        s=100,
+        c=colors,
+        alpha=0.6,
+        edgecolors="none" if rasterize else "white",
+        linewidth=0 if rasterize else 1.5,
+        zorder=2,
+        rasterized=rasterize,
     )
 
-    # Add labels with collision avoidance
+    # Merge labels of points that land on (nearly) the same pixel: they would be
+    # indistinguishable anyway, and every extra label slows down adjust_text
+    label_x, label_y, labels = _merge_coincident_labels(ax, x_values, y_values, labels)
+
+    # Label only a reproducible random sample of very large point sets (all points
+    # are still plotted); adjust_text cannot untangle that many labels anyway
+    if len(labels) > max_labels:
+        rng = np.random.default_rng(0)
+        sample = np.sort(rng.choice(len(labels), size=max_labels, replace=False))
+        label_x, label_y = label_x[sample], label_y[sample]
+        labels = [labels[i] for i in sample.tolist()]
+
+    # Add labels with collision avoidance (bbox and font are shared; matplotlib
+    # copies both into each Text). The font is built per plot because it picks up
+    # the family from rcParams, which the style may have changed.
+    label_font = FontProperties(size=8)
     texts = [
-        ax.text(
-            x,
-            y,
-            label,
-            fontsize=8,
-            ha="center",
-            va="center",
-            bbox=dict(boxstyle="round,pad=0.3", facecolor="white", edgecolor="none", alpha=0.7),
-        )
-        for x, y, label in zip(x_values, y_values, labels)
+        ax.text(x, y, label, ha="center", va="center", fontproperties=label_font, bbox=_LABEL_BBOX)
+        for x, y, label in zip(label_x, label_y, labels)
     ]
 
-    # Adjust text positions to avoid overlaps
-    adjust_text(
-        texts,
-        arrowprops=dict(arrowstyle="->", color="gray", lw=0.5, alpha=0.5),
-        expand_points=(1.5, 1.5),  # How much to repel from points
-        expand_text=(1.2, 1.2),  # How much to repel from other text
-        force_points=(0.5, 0.5),  # Force multiplier for point repulsion
-        force_text=(0.5, 0.5),  # Force multiplier for text repulsion
-        lim=500,  # Max iterations
-    )
+    # Adjust text positions to avoid overlaps (adjustText measures every label once,
+    # then iterates on NumPy arrays and writes the final positions back)
+    if len(texts) <= ADJUST_TEXT_MAX or force_adjust_text:
+        adjust_text(
+            texts,
+            ax=ax,
+            arrowprops=dict(arrowstyle="->", color="gray", lw=0.5, alpha=0.5),
+            expand=(1.2, 1.2),  # How much to repel from other text
+            force_static=(0.5, 0.5),  # Force multiplier for point repulsion
+            force_text=(0.5, 0.5),  # Force multiplier for text repulsion
+            iter_lim=500,  # Max iterations
+        )
 
     # Styling
     ax.set_xlabel(data.get("xlabel", "X"), fontsize=12, fontweight="bold")
@@ -275,7 +643,13 @@ def create_scatter_plot(data, figsize=(12, 8), style="default"):
     # Format y-axis if discrete tiers
     if len(unique_y) <= 10:
         ax.set_yticks(unique_y)
-        ax.set_yticklabels([f"Tier {int(y)}" if y == int(y) else str(y) for y in unique_y])
+        # Whole-number tiers read "Tier N", anything else keeps its value
+        tier_numbers = unique_y.astype(np.int64)
+        is_whole = unique_y == tier_numbers
+        tick_labels = np.where(
+            is_whole, np.char.add("Tier ", tier_numbers.astype(str)), unique_y.astype(str)
+        )
+        ax.set_yticklabels(tick_labels.tolist())
 
     # Tight layout
     plt.tight_layout()
@@ -283,6 +657,88 @@ def create_scatter_plot(data, figsize=(12, 8), style="default"):
     return fig
 
 
+def _merge_coincident_labels(ax, x_values, y_values, labels, cell_size=8):
+    """
+    Merge labels of points that fall in the same cell_size-pixel grid cell.
+
+    The first point in each cell keeps its label, with " (+N)" appended when
+    N other points were merged into it. Plots with at most
+    MERGE_LABELS_MIN_POINTS points keep every label.
+
+    Args:
+        ax: Axes the points are plotted on
+        x_values: Array of x coordinates
+        y_values: Array of y coordinates
+        labels: List of labels, one per point
+        cell_size: Grid cell size in pixels
+
+    Returns:
+        Tuple of (x_values, y_values, labels) for the labels to draw
+    """
+    if len(labels) <= MERGE_LABELS_MIN_POINTS:
+        return x_values, y_values, labels
+
+    import numpy as np
+
+    # Settle the data limits so transData maps to final pixel positions
+    ax.autoscale_view()
+    pixels = ax.transData.transform(np.column_stack([x_values, y_values]))
+
+    # Points with a missing (NaN) or infinite coordinate have no cell; they are
+    # passed through unmerged rather than all landing in one bogus cell
+    finite = np.isfinite(pixels).all(axis=1)
+    finite_index = np.flatnonzero(finite)
+    cells = np.round(pixels[finite] / cell_size).astype(np.int64)
+
+    _, first, counts = np.unique(cells, axis=0, return_index=True, return_counts=True)
+    if len(first) == len(finite_index):
+        return x_values, y_values, labels
+
+    # Keep the surviving labels in input order
+    keep = np.concatenate([finite_index[first], np.flatnonzero(~finite)])
+    counts = np.concatenate([counts, np.ones(len(labels) - len(finite_index), dtype=counts.dtype)])
+    order = np.argsort(keep)
+    keep, counts = keep[order], counts[order]
+    merged_labels = [
+        labels[i] if n == 1 else f"{labels[i]} (+{n - 1})"
+        for i, n in zip(keep.tolist(), counts.tolist())
+    ]
+    return x_values[keep], y_values[keep], merged_labels
+
+
+def _use_style(style):
+    """Apply a matplotlib style, parsing style files only once."""
+    import matplotlib.pyplot as plt
+
+    # Lists and dicts of styles/rcParams go to matplotlib unchanged
+    if isinstance(style, (str, os.PathLike)) and os.path.isfile(style):
+        style = _read_style_file(style, os.stat(style).st_mtime_ns)
+    plt.style.use(style)
+
+
+@functools.lru_cache(maxsize=None)
+def _read_style_file(path, mtime_ns):
+    """Parse a style file (mtime_ns is part of the cache key so edits are picked up)."""
+    import matplotlib
+
+    return matplotlib.rc_params_from_file(path, use_default_template=False)
+
+
+def warm_matplotlib():
+    """
+    Pay matplotlib's one-off startup costs ahead of the first plot.
+
+    Creates and closes a throwaway figure so the backend is loaded, and
+    resolves the default font so the font cache is populated.
+    """
+    import matplotlib.pyplot as plt
+    from matplotlib import font_manager
+
+    fig, _ = plt.subplots()
+    plt.close(fig)
+    font_manager.fontManager.findfont(font_manager.FontProperties())
+
+
 def save_figure(fig, output_path=None, format="svg", dpi=300):
     """
     Save figure to file or stdout.
@@ -290,22 +746,17 @@ def save_figure(fig, output_path=None, format="svg", dpi=300):
     Args:
         fig: matplotlib Figure object
         output_path: Path to save (None = stdout)
-        format: 'svg', 'png', or 'pdf'
-        dpi: Resolution for raster formats (PNG)
+        format: 'svg', 'svgz', 'png', or 'pdf'
+        dpi: Resolution for raster formats (PNG) and rasterized artists
     """
     if output_path:
         # Save to file
         fig.savefig(output_path, format=format, dpi=dpi, bbox_inches="tight")
     else:
-        # Save to stdout
-        if format == "png":
-            output = io.BytesIO()
-            fig.savefig(output, format=format, dpi=dpi, bbox_inches="tight")
-            sys.stdout.buffer.write(output.getvalue())
-        else:
-            output = io.StringIO()
-            fig.savefig(output, format=format, dpi=dpi, bbox_inches="tight")
-            sys.stdout.write(output.getvalue())
+        # Stream every format straight to the underlying byte stream; matplotlib
+        # encodes SVG as UTF-8 itself, so no intermediate text copy is made
+        stream = getattr(sys.stdout, "buffer", sys.stdout)
+        fig.savefig(stream, format=format, dpi=dpi, bbox_inches="tight")
 
 
 def main():
@@ -316,7 +767,9 @@ def main():
         epilog=__doc__,
     )
     parser.add_argument("input", nargs="?", help="Input file (JSON or CSV), or read from stdin")
-    parser.add_argument("output", nargs="?", help="Output file (SVG, PNG, PDF), or write to stdout")
+    parser.add_argument(
+        "output", nargs="?", help="Output file (SVG, SVGZ, PNG, PDF), or write to stdout"
+    )
     parser.add_argument(
         "--width", type=float, default=12, help="Figure width in inches (default: 12)"
     )
@@ -327,9 +780,34 @@ def main():
         "--style", default="default", help="Matplotlib style (default, seaborn, ggplot, etc.)"
     )
     parser.add_argument(
-        "--format", choices=["svg", "png", "pdf"], help="Output format (auto-detect from filename)"
+        "--format",
+        choices=["svg", "svgz", "png", "pdf"],
+        help="Output format (auto-detect from filename); svgz is gzip-compressed SVG",
+    )
+    parser.add_argument(
+        "--dpi",
+        type=int,
+        default=300,
+        help="DPI for PNG output and rasterized markers (default: 300)",
+    )
+    parser.add_argument(
+        "--max-labels",
+        type=int,
+        default=5000,
+        help="Label only a random sample of this many points when there are more "
+        "(default: 5000)",
+    )
+    parser.add_argument(
+        "--rasterize-threshold",
+        type=int,
+        default=2000,
+        help="Rasterize markers when there are more points than this (default: 2000)",
+    )
+    parser.add_argument(
+        "--force-adjust-text",
+        action="store_true",
+        help=f"Resolve label overlaps even with more than {ADJUST_TEXT_MAX} labels (slow)",
     )
-    parser.add_argument("--dpi", type=int, default=300, help="DPI for PNG output (default: 300)")
 
     args = parser.parse_args()
 
@@ -353,8 +831,21 @@ def main():
     else:
         output_format = args.format or "svg"
 
+    # Render without a GUI backend
+    import matplotlib
+
+    matplotlib.use("Agg")
+    import matplotlib.pyplot as plt
+
     # Create plot
-    fig = create_scatter_plot(data, figsize=(args.width, args.height), style=args.style)
+    fig = create_scatter_plot(
+        data,
+        figsize=(args.width, args.height),
+        style=args.style,
+        rasterize_threshold=args.rasterize_threshold,
+        max_labels=args.max_labels,
+        force_adjust_text=args.force_adjust_text,
+    )
 
     # Save plot
     save_figure(fig, args.output, format=output_format, dpi=args.dpi)
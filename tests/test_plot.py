@@ -20,17 +20,28 @@ import unittest
 from unittest.mock import mock_open, patch, MagicMock
 import json
 import io
+import math
+import warnings
 import tempfile
 import os
 
+try:
+    import pandas as pd
+except ImportError:  # pandas is an optional dependency
+    pd = None
+
 # Import from scatter_svg package
 from scatter_svg.plot import (
+    Point,
     detect_file_format,
     load_csv_file,
+    load_csv_file_iter,
+    load_csv_file_pandas,
     load_json_file,
     load_json_stdin,
     load_stdin,
     load_data_file,
+    load_data_files,
     create_scatter_plot,
     save_figure,
 )
@@ -44,40 +55,41 @@ class TestFileFormatDetection(unittest.TestCase):
 
     def test_detect_csv_by_extension(self):
         """Should detect CSV format from .csv extension."""
-        with patch("pathlib.Path.exists", return_value=True):
-            format_type = detect_file_format("data.csv")
-            self.assertEqual(format_type, "csv")
+        format_type = detect_file_format("data.csv")
+        self.assertEqual(format_type, "csv")
 
     def test_detect_json_by_extension(self):
         """Should detect JSON format from .json extension."""
-        with patch("pathlib.Path.exists", return_value=True):
-            format_type = detect_file_format("data.json")
-            self.assertEqual(format_type, "json")
+        format_type = detect_file_format("data.json")
+        self.assertEqual(format_type, "json")
 
     def test_detect_csv_case_insensitive(self):
         """Should detect CSV format case-insensitively."""
-        with patch("pathlib.Path.exists", return_value=True):
-            format_type = detect_file_format("data.CSV")
-            self.assertEqual(format_type, "csv")
+        format_type = detect_file_format("data.CSV")
+        self.assertEqual(format_type, "csv")
 
     def test_detect_json_case_insensitive(self):
         """Should detect JSON format case-insensitively."""
-        with patch("pathlib.Path.exists", return_value=True):
-            format_type = detect_file_format("data.JSON")
-            self.assertEqual(format_type, "json")
+        format_type = detect_file_format("data.JSON")
+        self.assertEqual(format_type, "json")
 
-    def test_detect_json_by_content(self):
-        """Should detect JSON format by parsing content when no extension."""
-        json_content = '{"points": [{"x": 1, "y": 2, "label": "test"}]}'
-        m = mock_open(read_data=json_content)
+    def test_detect_by_extension_without_file_access(self):
+        """Should decide from the extension without touching the filesystem."""
+        with patch("builtins.open") as mock_file:
+            self.assertEqual(detect_file_format("data.csv"), "csv")
+            self.assertEqual(detect_file_format("data.json"), "json")
+            mock_file.assert_not_called()
 
-        with patch("builtins.open", m):
+    def test_detect_json_by_content(self):
+        """Should detect JSON format from content when no extension."""
+        json_content = b'{"points": [{"x": 1, "y": 2, "label": "test"}]}'
+        with patch("builtins.open", return_value=io.BytesIO(json_content)):
             format_type = detect_file_format("data.txt")
             self.assertEqual(format_type, "json")
 
     def test_detect_csv_by_content_fallback(self):
-        """Should default to CSV when JSON parsing fails."""
-        csv_content = "label,x,y\ntest,1,2"
+        """Should default to CSV when content does not look like JSON."""
+        csv_content = b"label,x,y\ntest,1,2"
         m = mock_open(read_data=csv_content)
 
         with patch("builtins.open", m):
@@ -90,6 +102,23 @@ class TestFileFormatDetection(unittest.TestCase):
             format_type = detect_file_format("nonexistent.txt")
             self.assertEqual(format_type, "csv")
 
+    def test_detect_json_array_with_leading_whitespace(self):
+        """Should detect JSON that starts with whitespace and an array."""
+        m = mock_open(read_data=b'\n  [{"x": 1, "y": 2, "label": "test"}]')
+
+        with patch("builtins.open", m):
+            format_type = detect_file_format("data.txt")
+            self.assertEqual(format_type, "json")
+
+    def test_detect_json_after_long_whitespace(self):
+        """Should look past leading whitespace within the sniffed prefix."""
+        content = b" " * 200 + b'{"points": []}'
+
+        with patch("builtins.open", mock_open(read_data=content)) as m:
+            format_type = detect_file_format("data.txt")
+            self.assertEqual(format_type, "json")
+            m().read.assert_called_once_with(plot_module._SNIFF_BYTES)
+
 
 class TestJSONLoading(unittest.TestCase):
     """Test JSON data loading from files and stdin."""
@@ -105,20 +134,16 @@ class TestJSONLoading(unittest.TestCase):
                 {"x": 200, "y": 4, "label": "model-b"},
             ],
         }
-        json_content = json.dumps(json_data)
-        m = mock_open(read_data=json_content)
-
-        with patch("builtins.open", m):
+        json_content = json.dumps(json_data).encode()
+        with patch("builtins.open", return_value=io.BytesIO(json_content)):
             result = load_json_file("test.json")
             self.assertEqual(result, json_data)
 
     def test_load_json_file_minimal(self):
         """Should load JSON with only points (no metadata)."""
         json_data = {"points": [{"x": 100, "y": 5, "label": "model-a"}]}
-        json_content = json.dumps(json_data)
-        m = mock_open(read_data=json_content)
-
-        with patch("builtins.open", m):
+        json_content = json.dumps(json_data).encode()
+        with patch("builtins.open", return_value=io.BytesIO(json_content)):
             result = load_json_file("test.json")
             self.assertEqual(result["points"][0]["label"], "model-a")
 
@@ -126,19 +151,49 @@ class TestJSONLoading(unittest.TestCase):
         """Should load JSON from stdin."""
         json_data = {"points": [{"x": 100, "y": 5, "label": "test"}]}
 
-        with patch("sys.stdin", io.StringIO(json.dumps(json_data))):
+        stdin = io.TextIOWrapper(io.BytesIO(json.dumps(json_data).encode()))
+        with patch("sys.stdin", stdin):
             result = load_json_stdin()
             self.assertEqual(result, json_data)
 
     def test_load_json_file_invalid(self):
         """Should raise error on invalid JSON."""
-        invalid_json = '{"points": [invalid json'
-        m = mock_open(read_data=invalid_json)
+        invalid_json = b'{"points": [invalid json'
 
-        with patch("builtins.open", m):
+        with patch("builtins.open", return_value=io.BytesIO(invalid_json)):
             with self.assertRaises(json.JSONDecodeError):
                 load_json_file("invalid.json")
 
+    def test_load_json_file_uses_fastest_parser(self):
+        """Should parse JSON files with _json_loads (orjson when installed)."""
+        json_content = b'{"points": []}'
+
+        with patch("builtins.open", return_value=io.BytesIO(json_content)):
+            with patch.object(plot_module, "_json_loads", wraps=json.loads) as mock_loads:
+                result = load_json_file("test.json")
+
+        self.assertEqual(result, {"points": []})
+        mock_loads.assert_called_once_with(json_content)
+
+    def test_load_json_file_nan_literals(self):
+        """Should accept the NaN/Infinity literals that json.dumps writes."""
+        content = b'{"points": [{"x": NaN, "y": Infinity, "label": "model-a"}]}'
+
+        with patch("builtins.open", return_value=io.BytesIO(content)):
+            result = load_json_file("nan.json")
+
+        point = result["points"][0]
+        self.assertTrue(math.isnan(point["x"]))
+        self.assertEqual(point["y"], float("inf"))
+
+    def test_load_json_file_trailing_data(self):
+        """Should reject data after the top-level JSON value."""
+        content = b'{"points": []} garbage'
+
+        with patch("builtins.open", return_value=io.BytesIO(content)):
+            with self.assertRaises(json.JSONDecodeError):
+                load_json_file("trailing.json")
+
 
 class TestStdinAutodetection(unittest.TestCase):
     """Test stdin autodetection of JSON vs CSV format."""
@@ -153,7 +208,7 @@ class TestStdinAutodetection(unittest.TestCase):
             self.assertEqual(result["title"], "Test Plot")
 
     def test_load_stdin_csv(self):
-        """Should load CSV from stdin when JSON parsing fails."""
+        """Should load CSV from stdin when content does not look like JSON."""
         csv_content = "label,x,y\nmodel-a,100,5\nmodel-b,200,4"
 
         with patch("sys.stdin", io.StringIO(csv_content)):
@@ -204,6 +259,76 @@ class TestStdinAutodetection(unittest.TestCase):
             self.assertAlmostEqual(result["points"][0]["x"], 123.45)
             self.assertAlmostEqual(result["points"][0]["y"], 4.8)
 
+    def test_load_stdin_leading_whitespace(self):
+        """Should skip leading whitespace before detecting the format."""
+        json_data = {"points": [{"x": 100, "y": 5, "label": "test-model"}]}
+
+        with patch("sys.stdin", io.StringIO("\n  " + json.dumps(json_data))):
+            result = load_stdin()
+            self.assertEqual(result, json_data)
+
+        with patch("sys.stdin", io.StringIO("\n  label,x,y\nmodel-a,100,5\n")):
+            result = load_stdin()
+            self.assertEqual(result["points"][0]["label"], "model-a")
+            self.assertEqual(result["xlabel"], "x")
+
+    def test_load_stdin_malformed_json(self):
+        """Should raise JSONDecodeError instead of falling back to CSV."""
+        with patch("sys.stdin", io.StringIO('{"points": [')):
+            with self.assertRaises(json.JSONDecodeError):
+                load_stdin()
+
+    @staticmethod
+    def _byte_stdin(text):
+        """Build a stdin replacement backed by a peekable byte buffer, like sys.stdin."""
+        return io.TextIOWrapper(io.BufferedReader(io.BytesIO(text.encode())), encoding="utf-8")
+
+    def test_load_stdin_buffered_json(self):
+        """Should hand the JSON bytes to the parser without rebuilding the text."""
+        json_data = {"points": [{"x": 100, "y": 5, "label": "test-model"}]}
+        raw = json.dumps(json_data)
+
+        with patch("sys.stdin", self._byte_stdin("\n  " + raw)):
+            with patch.object(plot_module, "_json_loads", wraps=json.loads) as mock_loads:
+                result = load_stdin()
+
+        self.assertEqual(result, json_data)
+        mock_loads.assert_called_once_with(raw.encode())
+
+    def test_load_stdin_buffered_csv(self):
+        """Should read CSV through the text layer after peeking at the byte buffer."""
+        csv_content = "\n  label,x,y\nmodel-a,100,5\nmodel-b,200,4\n"
+
+        with patch("sys.stdin", self._byte_stdin(csv_content)):
+            result = load_stdin()
+
+        self.assertEqual(len(result["points"]), 2)
+        self.assertEqual(result["points"][0]["label"], "model-a")
+        self.assertEqual(result["xlabel"], "x")
+
+    def test_load_stdin_csv_byte_order_mark(self):
+        """Should drop a UTF-8 byte order mark from the CSV header on stdin."""
+        csv_content = "\ufeffx,label,y\n100,model-a,5\n"
+
+        for stdin in (self._byte_stdin(csv_content), io.StringIO(csv_content)):
+            with patch("sys.stdin", stdin):
+                result = load_stdin()
+
+            self.assertEqual(result["xlabel"], "x")
+            self.assertEqual(result["points"][0]["label"], "model-a")
+
+    def test_load_stdin_buffered_empty(self):
+        """Should raise ValueError on empty stdin with a byte buffer."""
+        with patch("sys.stdin", self._byte_stdin("  \n")):
+            with self.assertRaises(ValueError):
+                load_stdin()
+
+    def test_load_stdin_empty(self):
+        """Should raise ValueError on empty stdin."""
+        with patch("sys.stdin", io.StringIO("")):
+            with self.assertRaises(ValueError):
+                load_stdin()
+
 
 class TestCSVLoading(unittest.TestCase):
     """Test CSV data loading and column detection."""
@@ -211,12 +336,9 @@ class TestCSVLoading(unittest.TestCase):
     def test_load_csv_standard_columns(self):
         """Should load CSV with standard column names (label,x,y)."""
 
-        with patch("pandas.read_csv") as mock_read_csv:
-            import pandas as pd
-
-            mock_df = pd.DataFrame({"label": ["model-a", "model-b"], "x": [100, 200], "y": [5, 4]})
-            mock_read_csv.return_value = mock_df
+        csv_content = "label,x,y\nmodel-a,100,5\nmodel-b,200,4\n"
 
+        with patch("builtins.open", mock_open(read_data=csv_content)):
             result = load_csv_file("test.csv")
 
             self.assertEqual(len(result["points"]), 2)
@@ -229,12 +351,9 @@ class TestCSVLoading(unittest.TestCase):
     def test_load_csv_custom_columns(self):
         """Should detect custom column names (speed_ms, quality_tier)."""
 
-        with patch("pandas.read_csv") as mock_read_csv:
-            import pandas as pd
-
-            mock_df = pd.DataFrame({"label": ["model-a"], "speed_ms": [556], "quality_tier": [5]})
-            mock_read_csv.return_value = mock_df
+        csv_content = "label,speed_ms,quality_tier\nmodel-a,556,5\n"
 
+        with patch("builtins.open", mock_open(read_data=csv_content)):
             result = load_csv_file("test.csv")
 
             self.assertEqual(result["points"][0]["x"], 556)
@@ -244,12 +363,9 @@ class TestCSVLoading(unittest.TestCase):
 
     def test_load_csv_name_column(self):
         """Should detect 'name' as label column."""
-        with patch("pandas.read_csv") as mock_read_csv:
-            import pandas as pd
-
-            mock_df = pd.DataFrame({"name": ["model-a"], "time": [100], "quality": [5]})
-            mock_read_csv.return_value = mock_df
+        csv_content = "name,time,quality\nmodel-a,100,5\n"
 
+        with patch("builtins.open", mock_open(read_data=csv_content)):
             result = load_csv_file("test.csv")
 
             self.assertEqual(result["points"][0]["label"], "model-a")
@@ -258,12 +374,9 @@ class TestCSVLoading(unittest.TestCase):
 
     def test_load_csv_positional_columns(self):
         """Should fall back to positional columns when no match found."""
-        with patch("pandas.read_csv") as mock_read_csv:
-            import pandas as pd
-
-            mock_df = pd.DataFrame({"col1": ["model-a"], "col2": [100], "col3": [5]})
-            mock_read_csv.return_value = mock_df
+        csv_content = "col1,col2,col3\nmodel-a,100,5\n"
 
+        with patch("builtins.open", mock_open(read_data=csv_content)):
             result = load_csv_file("test.csv")
 
             self.assertEqual(result["points"][0]["label"], "model-a")
@@ -272,20 +385,148 @@ class TestCSVLoading(unittest.TestCase):
 
     def test_load_csv_multiple_rows(self):
         """Should load multiple CSV rows correctly."""
-        with patch("pandas.read_csv") as mock_read_csv:
-            import pandas as pd
-
-            mock_df = pd.DataFrame(
-                {"label": ["model-a", "model-b", "model-c"], "x": [100, 200, 300], "y": [5, 4, 5]}
-            )
-            mock_read_csv.return_value = mock_df
+        csv_content = "label,x,y\nmodel-a,100,5\nmodel-b,200,4\nmodel-c,300,5\n"
 
+        with patch("builtins.open", mock_open(read_data=csv_content)):
             result = load_csv_file("test.csv")
 
             self.assertEqual(len(result["points"]), 3)
             self.assertEqual(result["points"][2]["label"], "model-c")
             self.assertEqual(result["points"][2]["x"], 300)
 
+    def test_load_csv_file_iter(self):
+        """Should stream points lazily, using the same column detection."""
+        csv_content = "name,speed_ms,quality_tier\nfast-model,556,5\n\nslow-model,1200,3\n"
+
+        with patch("builtins.open", mock_open(read_data=csv_content)) as mocked:
+            points = load_csv_file_iter("test.csv")
+            mocked.assert_not_called()
+
+            self.assertEqual(
+                list(points),
+                [Point("fast-model", 556.0, 5.0), Point("slow-model", 1200.0, 3.0)],
+            )
+
+    @unittest.skipIf(pd is None, "pandas is not installed")
+    def test_load_csv_file_pandas(self):
+        """Should load CSV through pandas when requested."""
+        with patch("pandas.read_csv") as mock_read_csv:
+            mock_df = pd.DataFrame({"label": ["model-a", "model-b"], "x": [100, 200], "y": [5, 4]})
+            mock_read_csv.return_value = mock_df
+
+            result = load_csv_file_pandas("test.csv")
+
+            self.assertEqual(len(result["points"]), 2)
+            self.assertEqual(result["points"][1]["label"], "model-b")
+            self.assertEqual(result["points"][1]["x"], 200)
+            self.assertEqual(result["xlabel"], "x")
+            self.assertEqual(result["ylabel"], "y")
+
+    def test_load_csv_blank_lines(self):
+        """Should skip blank lines in CSV input."""
+        csv_content = "label,x,y\nmodel-a,100,5\n\nmodel-b,200,4\n\n"
+
+        with patch("builtins.open", mock_open(read_data=csv_content)):
+            result = load_csv_file("test.csv")
+
+            self.assertEqual(len(result["points"]), 2)
+
+    def test_load_csv_blank_cell(self):
+        """Should read an empty x or y field as NaN."""
+        csv_content = "label,x,y\nmodel-a,100,\nmodel-b,,4\n"
+
+        with patch("builtins.open", mock_open(read_data=csv_content)):
+            result = load_csv_file("test.csv")
+
+        self.assertEqual(result["points"][0]["x"], 100.0)
+        self.assertTrue(math.isnan(result["points"][0]["y"]))
+        self.assertTrue(math.isnan(result["points"][1]["x"]))
+        self.assertEqual(result["points"][1]["y"], 4.0)
+
+    def test_load_csv_na_markers(self):
+        """Should read pandas' default NA markers as NaN."""
+        csv_content = "label,x,y\nmodel-a,100,NA\nmodel-b,N/A,4\nmodel-c,null,#N/A\n"
+
+        with patch("builtins.open", mock_open(read_data=csv_content)):
+            result = load_csv_file("test.csv")
+
+        points = result["points"]
+        self.assertEqual(points[0]["x"], 100.0)
+        self.assertTrue(math.isnan(points[0]["y"]))
+        self.assertTrue(math.isnan(points[1]["x"]))
+        self.assertTrue(math.isnan(points[2]["x"]))
+        self.assertTrue(math.isnan(points[2]["y"]))
+
+    def test_load_csv_short_row(self):
+        """Should read fields missing from a short row as NaN."""
+        csv_content = "label,x,y\nmodel-a,100\nmodel-b,200,4\n"
+
+        with patch("builtins.open", mock_open(read_data=csv_content)):
+            result = load_csv_file("test.csv")
+
+        self.assertEqual(len(result["points"]), 2)
+        self.assertEqual(result["points"][0]["label"], "model-a")
+        self.assertTrue(math.isnan(result["points"][0]["y"]))
+
+    def test_load_csv_non_numeric_value(self):
+        """Should name the offending line when a value is not a number."""
+        csv_content = "label,x,y\nmodel-a,100,5\nmodel-b,fast,4\n"
+
+        with patch("builtins.open", mock_open(read_data=csv_content)):
+            with self.assertRaisesRegex(ValueError, "line 3"):
+                load_csv_file("test.csv")
+
+
+class TestPoint(unittest.TestCase):
+    """Test the compact point type returned by the CSV loaders."""
+
+    def test_attribute_and_item_access(self):
+        """Should expose fields as attributes and as dict-style items."""
+        point = Point("model-a", 100.0, 5.0)
+
+        self.assertEqual(point.label, "model-a")
+        self.assertEqual(point["x"], 100.0)
+        self.assertEqual(point["y"], 5.0)
+
+    def test_unknown_key(self):
+        """Should raise KeyError for unknown keys."""
+        with self.assertRaises(KeyError):
+            Point("model-a", 100.0, 5.0)["z"]
+
+    def test_equality(self):
+        """Should compare equal by value."""
+        self.assertEqual(Point("a", 1.0, 2.0), Point("a", 1.0, 2.0))
+        self.assertNotEqual(Point("a", 1.0, 2.0), Point("b", 1.0, 2.0))
+
+    def test_mapping_interface(self):
+        """Should behave like a read-only point dict."""
+        point = Point("model-a", 100.0, 5.0)
+        as_dict = {"label": "model-a", "x": 100.0, "y": 5.0}
+
+        self.assertIn("x", point)
+        self.assertNotIn("z", point)
+        self.assertEqual(point.get("y"), 5.0)
+        self.assertIsNone(point.get("z"))
+        self.assertEqual(list(point.keys()), ["label", "x", "y"])
+        self.assertEqual(dict(point), as_dict)
+        self.assertEqual(point, as_dict)
+        self.assertFalse(hasattr(point, "__dict__"))
+
+    def test_to_dict(self):
+        """Should convert to a plain dict that json can serialize."""
+        point = Point("model-a", 100.0, 5.0)
+
+        self.assertEqual(
+            json.loads(json.dumps(point.to_dict())), {"label": "model-a", "x": 100.0, "y": 5.0}
+        )
+
+    def test_csv_loader_returns_points(self):
+        """Should return Point objects from the CSV loader."""
+        with patch("builtins.open", mock_open(read_data="label,x,y\nmodel-a,100,5\n")):
+            result = load_csv_file("test.csv")
+
+        self.assertEqual(result["points"], [Point("model-a", 100.0, 5.0)])
+
 
 class TestDataFileLoading(unittest.TestCase):
     """Test integrated file loading with automatic format detection."""
@@ -313,27 +554,54 @@ class TestDataFileLoading(unittest.TestCase):
                 self.assertEqual(result, {"points": []})
 
 
+class TestBatchLoad(unittest.TestCase):
+    """Test loading several data files at once."""
+
+    def test_results_in_input_order(self):
+        """Should return one result per path, in input order."""
+        with tempfile.TemporaryDirectory() as test_dir:
+            paths = []
+            for i in range(5):
+                if i % 2:
+                    path = os.path.join(test_dir, f"data{i}.json")
+                    with open(path, "w") as f:
+                        json.dump({"title": f"File {i}", "points": []}, f)
+                else:
+                    path = os.path.join(test_dir, f"data{i}.csv")
+                    with open(path, "w") as f:
+                        f.write(f"label,x,y\nfile-{i},{i},1\n")
+                paths.append(path)
+
+            results = load_data_files(paths)
+
+        self.assertEqual(len(results), 5)
+        for i, result in enumerate(results):
+            if i % 2:
+                self.assertEqual(result["title"], f"File {i}")
+            else:
+                self.assertEqual(result["points"][0]["label"], f"file-{i}")
+
+    def test_empty_list(self):
+        """Should return an empty list for no paths."""
+        self.assertEqual(load_data_files([]), [])
+
+
 class TestEdgeCases(unittest.TestCase):
     """Test edge cases and error conditions."""
 
     def test_empty_json_points(self):
         """Should handle JSON with empty points array."""
         json_data = {"points": []}
-        json_content = json.dumps(json_data)
-        m = mock_open(read_data=json_content)
-
-        with patch("builtins.open", m):
+        json_content = json.dumps(json_data).encode()
+        with patch("builtins.open", return_value=io.BytesIO(json_content)):
             result = load_json_file("empty.json")
             self.assertEqual(result["points"], [])
 
     def test_empty_csv_file(self):
         """Should handle empty CSV file."""
-        with patch("pandas.read_csv") as mock_read_csv:
-            import pandas as pd
-
-            mock_df = pd.DataFrame(columns=["label", "x", "y"])
-            mock_read_csv.return_value = mock_df
+        csv_content = "label,x,y\n"
 
+        with patch("builtins.open", mock_open(read_data=csv_content)):
             result = load_csv_file("empty.csv")
 
             self.assertEqual(len(result["points"]), 0)
@@ -341,45 +609,33 @@ class TestEdgeCases(unittest.TestCase):
     def test_single_point_json(self):
         """Should handle JSON with single point."""
         json_data = {"points": [{"x": 100, "y": 5, "label": "only-one"}]}
-        json_content = json.dumps(json_data)
-        m = mock_open(read_data=json_content)
-
-        with patch("builtins.open", m):
+        json_content = json.dumps(json_data).encode()
+        with patch("builtins.open", return_value=io.BytesIO(json_content)):
             result = load_json_file("single.json")
             self.assertEqual(len(result["points"]), 1)
 
     def test_json_missing_optional_fields(self):
         """Should handle JSON without title/xlabel/ylabel."""
         json_data = {"points": [{"x": 1, "y": 2, "label": "test"}]}
-        json_content = json.dumps(json_data)
-        m = mock_open(read_data=json_content)
-
-        with patch("builtins.open", m):
+        json_content = json.dumps(json_data).encode()
+        with patch("builtins.open", return_value=io.BytesIO(json_content)):
             result = load_json_file("minimal.json")
             self.assertNotIn("title", result)
 
     def test_csv_with_spaces_in_names(self):
         """Should handle CSV with spaces in label names."""
-        with patch("pandas.read_csv") as mock_read_csv:
-            import pandas as pd
-
-            mock_df = pd.DataFrame(
-                {"label": ["model with spaces", "another model"], "x": [100, 200], "y": [5, 4]}
-            )
-            mock_read_csv.return_value = mock_df
+        csv_content = "label,x,y\nmodel with spaces,100,5\nanother model,200,4\n"
 
+        with patch("builtins.open", mock_open(read_data=csv_content)):
             result = load_csv_file("test.csv")
 
             self.assertEqual(result["points"][0]["label"], "model with spaces")
 
     def test_csv_with_float_values(self):
         """Should handle CSV with float x,y values."""
-        with patch("pandas.read_csv") as mock_read_csv:
-            import pandas as pd
-
-            mock_df = pd.DataFrame({"label": ["model-a"], "x": [123.45], "y": [4.8]})
-            mock_read_csv.return_value = mock_df
+        csv_content = "label,x,y\nmodel-a,123.45,4.8\n"
 
+        with patch("builtins.open", mock_open(read_data=csv_content)):
             result = load_csv_file("test.csv")
 
             self.assertAlmostEqual(result["points"][0]["x"], 123.45)
@@ -388,10 +644,8 @@ class TestEdgeCases(unittest.TestCase):
     def test_json_with_extra_fields(self):
         """Should handle JSON points with extra fields."""
         json_data = {"points": [{"x": 100, "y": 5, "label": "test", "extra": "ignored"}]}
-        json_content = json.dumps(json_data)
-        m = mock_open(read_data=json_content)
-
-        with patch("builtins.open", m):
+        json_content = json.dumps(json_data).encode()
+        with patch("builtins.open", return_value=io.BytesIO(json_content)):
             result = load_json_file("extra.json")
             # Should still load the essential fields
             self.assertEqual(result["points"][0]["x"], 100)
@@ -400,9 +654,9 @@ class TestEdgeCases(unittest.TestCase):
 class TestScatterPlotCreation(unittest.TestCase):
     """Test scatter plot creation logic."""
 
-    @patch("scatter_svg.plot.adjust_text")
-    @patch("scatter_svg.plot.plt.tight_layout")
-    @patch("scatter_svg.plot.plt.subplots")
+    @patch("adjustText.adjust_text")
+    @patch("matplotlib.pyplot.tight_layout")
+    @patch("matplotlib.pyplot.subplots")
     def test_create_scatter_plot_basic(self, mock_subplots, mock_tight_layout, mock_adjust_text):
         """Should create scatter plot with basic data."""
         # Mock matplotlib components
@@ -433,9 +687,33 @@ class TestScatterPlotCreation(unittest.TestCase):
         # Verify adjust_text was called
         mock_adjust_text.assert_called_once()
 
-    @patch("scatter_svg.plot.adjust_text")
-    @patch("scatter_svg.plot.plt.tight_layout")
-    @patch("scatter_svg.plot.plt.subplots")
+    @patch("adjustText.adjust_text")
+    @patch("matplotlib.pyplot.tight_layout")
+    @patch("matplotlib.pyplot.subplots")
+    def test_create_scatter_plot_point_objects(
+        self, mock_subplots, mock_tight_layout, mock_adjust_text
+    ):
+        """Should plot Points, dicts and a mix of both the same way."""
+        mock_ax = MagicMock()
+        mock_subplots.return_value = (MagicMock(), mock_ax)
+
+        for points in (
+            [Point("model-a", 100.0, 5.0), Point("model-b", 200.0, 4.0)],
+            [{"label": "model-a", "x": 100, "y": 5}, {"label": "model-b", "x": 200, "y": 4}],
+            [Point("model-a", 100.0, 5.0), {"label": "model-b", "x": 200, "y": 4}],
+        ):
+            mock_ax.reset_mock()
+            create_scatter_plot({"points": points})
+
+            x_values, y_values = mock_ax.scatter.call_args[0][:2]
+            self.assertEqual(x_values.tolist(), [100.0, 200.0])
+            self.assertEqual(y_values.tolist(), [5.0, 4.0])
+            drawn = [c[0][2] for c in mock_ax.text.call_args_list]
+            self.assertEqual(drawn, ["model-a", "model-b"])
+
+    @patch("adjustText.adjust_text")
+    @patch("matplotlib.pyplot.tight_layout")
+    @patch("matplotlib.pyplot.subplots")
     def test_create_scatter_plot_default_labels(
         self, mock_subplots, mock_tight_layout, mock_adjust_text
     ):
@@ -452,9 +730,9 @@ class TestScatterPlotCreation(unittest.TestCase):
         calls = mock_ax.set_xlabel.call_args[0]
         self.assertEqual(calls[0], "X")
 
-    @patch("scatter_svg.plot.adjust_text")
-    @patch("scatter_svg.plot.plt.tight_layout")
-    @patch("scatter_svg.plot.plt.subplots")
+    @patch("adjustText.adjust_text")
+    @patch("matplotlib.pyplot.tight_layout")
+    @patch("matplotlib.pyplot.subplots")
     def test_create_scatter_plot_custom_figsize(
         self, mock_subplots, mock_tight_layout, mock_adjust_text
     ):
@@ -469,10 +747,10 @@ class TestScatterPlotCreation(unittest.TestCase):
 
         mock_subplots.assert_called_with(figsize=(10, 6))
 
-    @patch("scatter_svg.plot.adjust_text")
-    @patch("scatter_svg.plot.plt.tight_layout")
-    @patch("scatter_svg.plot.plt.style")
-    @patch("scatter_svg.plot.plt.subplots")
+    @patch("adjustText.adjust_text")
+    @patch("matplotlib.pyplot.tight_layout")
+    @patch("matplotlib.pyplot.style")
+    @patch("matplotlib.pyplot.subplots")
     def test_create_scatter_plot_custom_style(
         self, mock_subplots, mock_style, mock_tight_layout, mock_adjust_text
     ):
@@ -487,6 +765,233 @@ class TestScatterPlotCreation(unittest.TestCase):
 
         mock_style.use.assert_called_with("seaborn")
 
+    @patch("adjustText.adjust_text")
+    @patch("matplotlib.pyplot.tight_layout")
+    @patch("matplotlib.pyplot.subplots")
+    def test_create_scatter_plot_reapplies_style(
+        self, mock_subplots, mock_tight_layout, mock_adjust_text
+    ):
+        """Should pick up an edited style file and rcParams reset by the caller."""
+        import matplotlib
+        import matplotlib.pyplot as plt
+
+        mock_subplots.return_value = (MagicMock(), MagicMock())
+        data = {"points": [{"x": 100, "y": 5, "label": "test"}]}
+
+        with tempfile.TemporaryDirectory() as test_dir, matplotlib.rc_context():
+            style_path = os.path.join(test_dir, "custom.mplstyle")
+            with open(style_path, "w") as f:
+                f.write("axes.facecolor: red\n")
+            os.utime(style_path, ns=(1_000_000_000, 1_000_000_000))
+
+            create_scatter_plot(data, style=style_path)
+            self.assertEqual(plt.rcParams["axes.facecolor"], "red")
+
+            plt.rcdefaults()
+            create_scatter_plot(data, style=style_path)
+            self.assertEqual(plt.rcParams["axes.facecolor"], "red")
+
+            with open(style_path, "w") as f:
+                f.write("axes.facecolor: blue\n")
+            os.utime(style_path, ns=(2_000_000_000, 2_000_000_000))
+
+            create_scatter_plot(data, style=style_path)
+            self.assertEqual(plt.rcParams["axes.facecolor"], "blue")
+
+    @patch("adjustText.adjust_text")
+    @patch("matplotlib.pyplot.tight_layout")
+    @patch("matplotlib.pyplot.subplots")
+    def test_create_scatter_plot_tier_colors(
+        self, mock_subplots, mock_tight_layout, mock_adjust_text
+    ):
+        """Should give points in the same tier the same color."""
+        mock_fig = MagicMock()
+        mock_ax = MagicMock()
+        mock_subplots.return_value = (mock_fig, mock_ax)
+
+        data = {
+            "points": [
+                {"x": 100, "y": 5, "label": "model-a"},
+                {"x": 200, "y": 4, "label": "model-b"},
+                {"x": 300, "y": 5, "label": "model-c"},
+            ]
+        }
+
+        create_scatter_plot(data)
+
+        colors = mock_ax.scatter.call_args[1]["c"]
+        self.assertEqual(list(colors[0]), list(colors[2]))
+        self.assertNotEqual(list(colors[0]), list(colors[1]))
+
+    @patch("adjustText.adjust_text")
+    @patch("matplotlib.pyplot.tight_layout")
+    @patch("matplotlib.pyplot.subplots")
+    def test_create_scatter_plot_rasterize_threshold(
+        self, mock_subplots, mock_tight_layout, mock_adjust_text
+    ):
+        """Should rasterize markers only above the threshold."""
+        mock_fig = MagicMock()
+        mock_ax = MagicMock()
+        mock_subplots.return_value = (mock_fig, mock_ax)
+
+        data = {
+            "points": [
+                {"x": 100, "y": 5, "label": "model-a"},
+                {"x": 200, "y": 4, "label": "model-b"},
+            ]
+        }
+
+        create_scatter_plot(data, rasterize_threshold=2)
+        self.assertFalse(mock_ax.scatter.call_args[1]["rasterized"])
+
+        create_scatter_plot(data, rasterize_threshold=1)
+        self.assertTrue(mock_ax.scatter.call_args[1]["rasterized"])
+        self.assertEqual(mock_ax.scatter.call_args[1]["edgecolors"], "none")
+
+    @patch("adjustText.adjust_text")
+    @patch("matplotlib.pyplot.tight_layout")
+    @patch("matplotlib.pyplot.subplots")
+    def test_create_scatter_plot_tier_tick_labels(
+        self, mock_subplots, mock_tight_layout, mock_adjust_text
+    ):
+        """Should label whole-number tiers as 'Tier N' and keep other values."""
+        mock_fig = MagicMock()
+        mock_ax = MagicMock()
+        mock_subplots.return_value = (mock_fig, mock_ax)
+
+        data = {
+            "points": [
+                {"x": 100, "y": 5.0, "label": "model-a"},
+                {"x": 200, "y": 4.5, "label": "model-b"},
+            ]
+        }
+
+        create_scatter_plot(data)
+
+        tick_labels = mock_ax.set_yticklabels.call_args[0][0]
+        self.assertEqual(tick_labels, ["4.5", "Tier 5"])
+
+    @patch("adjustText.adjust_text")
+    @patch("matplotlib.pyplot.tight_layout")
+    @patch("matplotlib.pyplot.subplots")
+    def test_create_scatter_plot_merges_coincident_labels(
+        self, mock_subplots, mock_tight_layout, mock_adjust_text
+    ):
+        """Should draw one label for points that share a position."""
+        mock_fig = MagicMock()
+        mock_ax = MagicMock()
+        # Treat data coordinates as pixels
+        mock_ax.transData.transform.side_effect = lambda xy: xy
+        mock_subplots.return_value = (mock_fig, mock_ax)
+
+        nan = float("nan")
+        data = {
+            "points": [
+                {"x": 100, "y": 5, "label": "model-a"},
+                {"x": nan, "y": 4, "label": "missing-x"},
+                {"x": 300, "y": 4, "label": "model-b"},
+                {"x": 100, "y": 5, "label": "model-c"},
+                {"x": 200, "y": nan, "label": "missing-y"},
+            ]
+        }
+
+        with patch.object(plot_module, "MERGE_LABELS_MIN_POINTS", 2):
+            with warnings.catch_warnings():
+                warnings.simplefilter("error", RuntimeWarning)
+                create_scatter_plot(data)
+
+        # Points without a finite position are never merged
+        drawn = [c[0][2] for c in mock_ax.text.call_args_list]
+        self.assertEqual(drawn, ["model-a (+1)", "missing-x", "model-b", "missing-y"])
+        self.assertEqual(len(mock_ax.scatter.call_args[0][0]), 5)
+
+    @patch("adjustText.adjust_text")
+    @patch("matplotlib.pyplot.tight_layout")
+    @patch("matplotlib.pyplot.subplots")
+    def test_create_scatter_plot_max_labels(
+        self, mock_subplots, mock_tight_layout, mock_adjust_text
+    ):
+        """Should plot every point but label only max_labels of them."""
+        mock_fig = MagicMock()
+        mock_ax = MagicMock()
+        mock_subplots.return_value = (mock_fig, mock_ax)
+
+        data = {
+            "points": [
+                {"x": 100, "y": 5, "label": "model-a"},
+                {"x": 200, "y": 4, "label": "model-b"},
+                {"x": 300, "y": 3, "label": "model-c"},
+            ]
+        }
+
+        create_scatter_plot(data, max_labels=2)
+
+        self.assertEqual(len(mock_ax.scatter.call_args[0][0]), 3)
+        self.assertEqual(mock_ax.text.call_count, 2)
+
+    def test_merging_starts_where_adjust_text_stops(self):
+        """Should leave no label count with neither merging nor adjust_text."""
+        self.assertLessEqual(plot_module.MERGE_LABELS_MIN_POINTS, plot_module.ADJUST_TEXT_MAX)
+
+    @patch("adjustText.adjust_text")
+    @patch("matplotlib.pyplot.tight_layout")
+    @patch("matplotlib.pyplot.subplots")
+    def test_create_scatter_plot_skips_adjust_text(
+        self, mock_subplots, mock_tight_layout, mock_adjust_text
+    ):
+        """Should skip adjust_text above ADJUST_TEXT_MAX labels unless forced."""
+        mock_fig = MagicMock()
+        mock_ax = MagicMock()
+        mock_subplots.return_value = (mock_fig, mock_ax)
+
+        data = {
+            "points": [
+                {"x": 100, "y": 5, "label": "model-a"},
+                {"x": 200, "y": 4, "label": "model-b"},
+                {"x": 300, "y": 3, "label": "model-c"},
+            ]
+        }
+
+        with patch.object(plot_module, "ADJUST_TEXT_MAX", 2):
+            create_scatter_plot(data)
+            mock_adjust_text.assert_not_called()
+
+            create_scatter_plot(data, force_adjust_text=True)
+            mock_adjust_text.assert_called_once()
+
+    @patch("matplotlib.pyplot.style")
+    @patch("matplotlib.rc_params_from_file", return_value={})
+    def test_style_file_parsed_once(self, mock_rc_params_from_file, mock_style):
+        """Should parse a style file once and reuse it on later calls."""
+        with tempfile.TemporaryDirectory() as test_dir:
+            style_path = os.path.join(test_dir, "custom.mplstyle")
+            with open(style_path, "w") as f:
+                f.write("axes.grid: True\n")
+
+            plot_module._read_style_file.cache_clear()
+            plot_module._use_style(style_path)
+            plot_module._use_style(style_path)
+
+        mock_rc_params_from_file.assert_called_once()
+        self.assertEqual(mock_style.use.call_count, 2)
+
+    @patch("adjustText.adjust_text")
+    @patch("matplotlib.pyplot.tight_layout")
+    @patch("matplotlib.pyplot.subplots")
+    @patch("matplotlib.pyplot.style")
+    def test_create_scatter_plot_list_and_dict_styles(
+        self, mock_style, mock_subplots, mock_tight_layout, mock_adjust_text
+    ):
+        """Should pass style lists and rcParams dicts straight to matplotlib."""
+        mock_subplots.return_value = (MagicMock(), MagicMock())
+        data = {"points": [{"x": 100, "y": 5, "label": "model-a"}]}
+
+        create_scatter_plot(data, style=["ggplot"])
+        mock_style.use.assert_called_with(["ggplot"])
+
+        create_scatter_plot(data, style={"axes.grid": True})
+        mock_style.use.assert_called_with({"axes.grid": True})
+
 
 class TestFigureSaving(unittest.TestCase):
     """Test figure saving to file and stdout."""
@@ -503,17 +1008,17 @@ class TestFigureSaving(unittest.TestCase):
         self.assertEqual(args[1]["format"], "svg")
 
     def test_save_figure_svg_to_stdout(self):
-        """Should save SVG to stdout."""
+        """Should save SVG to the stdout byte stream."""
         mock_fig = MagicMock()
-        output_buffer = io.StringIO()
 
-        with patch("sys.stdout", output_buffer):
-            with patch("io.StringIO") as mock_stringio:
-                mock_io = MagicMock()
-                mock_stringio.return_value = mock_io
-                mock_io.getvalue.return_value = "<svg>test</svg>"
+        with patch("sys.stdout") as mock_stdout:
+            mock_stdout.buffer = MagicMock()
+
+            save_figure(mock_fig, None, format="svg")
 
-                save_figure(mock_fig, None, format="svg")
+            args = mock_fig.savefig.call_args
+            self.assertIs(args[0][0], mock_stdout.buffer)
+            self.assertEqual(args[1]["format"], "svg")
 
     def test_save_figure_png_to_stdout(self):
         """Should save PNG to stdout buffer."""
@@ -521,14 +1026,25 @@ class TestFigureSaving(unittest.TestCase):
 
         with patch("sys.stdout") as mock_stdout:
             mock_stdout.buffer = MagicMock()
-            with patch("io.BytesIO") as mock_bytesio:
-                mock_io = MagicMock()
-                mock_bytesio.return_value = mock_io
-                mock_io.getvalue.return_value = b"PNG_DATA"
 
-                save_figure(mock_fig, None, format="png")
+            save_figure(mock_fig, None, format="png")
 
-                mock_stdout.buffer.write.assert_called_once()
+            args = mock_fig.savefig.call_args
+            self.assertIs(args[0][0], mock_stdout.buffer)
+            self.assertEqual(args[1]["format"], "png")
+
+    def test_save_figure_svgz_to_stdout(self):
+        """Should write gzip-compressed SVG to the stdout byte stream."""
+        mock_fig = MagicMock()
+
+        with patch("sys.stdout") as mock_stdout:
+            mock_stdout.buffer = MagicMock()
+
+            save_figure(mock_fig, None, format="svgz")
+
+            args = mock_fig.savefig.call_args
+            self.assertIs(args[0][0], mock_stdout.buffer)
+            self.assertEqual(args[1]["format"], "svgz")
 
     def test_save_figure_custom_dpi(self):
         """Should respect custom DPI setting."""
@@ -539,19 +1055,29 @@ class TestFigureSaving(unittest.TestCase):
         args = mock_fig.savefig.call_args
         self.assertEqual(args[1]["dpi"], 150)
 
+    def test_save_figure_tight_bbox(self):
+        """Should measure the tight bounding box at save time."""
+        mock_fig = MagicMock(spec=["savefig"])
+
+        save_figure(mock_fig, "output.svg", format="svg")
+
+        args = mock_fig.savefig.call_args
+        self.assertEqual(args[1]["bbox_inches"], "tight")
+
 
 class TestRealFileOperations(unittest.TestCase):
     """Test with real temporary files (integration tests)."""
 
-    def setUp(self):
-        """Create temporary directory for test files."""
-        self.test_dir = tempfile.mkdtemp()
+    @classmethod
+    def setUpClass(cls):
+        """Create one temporary directory shared by all tests in the class."""
+        cls._temp_dir = tempfile.TemporaryDirectory()
+        cls.test_dir = cls._temp_dir.name
 
-    def tearDown(self):
+    @classmethod
+    def tearDownClass(cls):
         """Clean up temporary files."""
-        import shutil
-
-        shutil.rmtree(self.test_dir)
+        cls._temp_dir.cleanup()
 
     def test_detect_real_csv_file(self):
         """Should detect real CSV file format."""
@@ -580,6 +1106,36 @@ class TestRealFileOperations(unittest.TestCase):
         format_type = detect_file_format(file_path)
         self.assertEqual(format_type, "json")
 
+    def test_detect_format_cached_until_modified(self):
+        """Should sniff an unchanged file once and re-sniff it after it changes."""
+        file_path = os.path.join(self.test_dir, "cached")
+        with open(file_path, "w") as f:
+            f.write("label,x,y\ntest,1,2\n")
+        os.utime(file_path, ns=(1_000_000_000, 1_000_000_000))
+
+        with patch("builtins.open", wraps=open) as spy_open:
+            self.assertEqual(detect_file_format(file_path), "csv")
+            self.assertEqual(detect_file_format(file_path), "csv")
+            self.assertEqual(spy_open.call_count, 1)
+
+        with open(file_path, "w") as f:
+            json.dump({"points": []}, f)
+        os.utime(file_path, ns=(2_000_000_000, 2_000_000_000))
+
+        self.assertEqual(detect_file_format(file_path), "json")
+
+    def test_load_real_csv_file_utf8_bom(self):
+        """Should read CSV files as UTF-8 and drop a byte order mark."""
+        csv_path = os.path.join(self.test_dir, "excel.csv")
+        with open(csv_path, "wb") as f:
+            f.write("\ufeffx,label,y\n100,café,5\n".encode("utf-8"))
+
+        result = load_csv_file(csv_path)
+        self.assertEqual(result["xlabel"], "x")
+        self.assertEqual(result["points"][0]["label"], "café")
+
+        self.assertEqual(list(load_csv_file_iter(csv_path)), [Point("café", 100.0, 5.0)])
+
     def test_load_real_json_file(self):
         """Should load real JSON file."""
         json_path = os.path.join(self.test_dir, "test.json")